@@ -1,6 +1,15 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
+import threading
+
+import ui_common
+
+try:
+    # C-accelerated flattener; avoids the pure-Python walk on big coord lists
+    from _tkinter import _flatten
+except ImportError:
+    from tkinter import _flatten
 
 class EmuNESGUI:
     def __init__(self, root):
@@ -13,10 +22,24 @@ class EmuNESGUI:
         self.rom_loaded = False
         self.rom_path = None
         self.is_playing = False
-        
+
+        # Last text applied per label, to skip redundant Tk round-trips
+        self._last_label_txt = {}
+
         self.setup_gui()
+
+    def _set_label(self, label, text):
+        """Update a status label only when its text actually changed."""
+        if self._last_label_txt.get(label) != text:
+            label.config(text=text)
+            self._last_label_txt[label] = text
         
     def setup_gui(self):
+        # Configure the shared button style once so Tk resolves it a single
+        # time instead of per-widget on every panel build.
+        style = ttk.Style(self.root)
+        style.configure('Tool.TButton', padding=2)
+
         # Main menu bar
         self.create_menu_bar()
         
@@ -37,86 +60,86 @@ class EmuNESGUI:
         self.create_status_bar()
         
     def create_menu_bar(self):
-        menubar = tk.Menu(self.root)
-        
-        # File menu
-        file_menu = tk.Menu(menubar, tearoff=0)
-        file_menu.add_command(label="Open ROM", command=self.open_rom, accelerator="Ctrl+O")
-        file_menu.add_command(label="Close ROM", command=self.close_rom)
-        file_menu.add_separator()
-        file_menu.add_command(label="Save State", command=self.save_state)
-        file_menu.add_command(label="Load State", command=self.load_state)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
-        menubar.add_cascade(label="File", menu=file_menu)
-        
-        # Emulation menu
-        emu_menu = tk.Menu(menubar, tearoff=0)
-        emu_menu.add_command(label="Play", command=self.play_emu, accelerator="F5")
-        emu_menu.add_command(label="Pause", command=self.pause_emu, accelerator="F6")
-        emu_menu.add_command(label="Reset", command=self.reset_emu, accelerator="F7")
-        emu_menu.add_separator()
-        emu_menu.add_command(label="Fullscreen", command=self.toggle_fullscreen, accelerator="Alt+Enter")
-        menubar.add_cascade(label="Emulation", menu=emu_menu)
-        
-        # Config menu
-        config_menu = tk.Menu(menubar, tearoff=0)
-        config_menu.add_command(label="Input", command=self.config_input)
-        config_menu.add_command(label="Video", command=self.config_video)
-        config_menu.add_command(label="Sound", command=self.config_sound)
-        menubar.add_cascade(label="Config", menu=config_menu)
-        
-        # Tools menu
-        tools_menu = tk.Menu(menubar, tearoff=0)
-        tools_menu.add_command(label="Cheats", command=self.open_cheats)
-        tools_menu.add_command(label="Debugger", command=self.open_debugger)
-        menubar.add_cascade(label="Tools", menu=tools_menu)
-        
-        # Help menu
-        help_menu = tk.Menu(menubar, tearoff=0)
-        help_menu.add_command(label="About", command=self.show_about)
-        menubar.add_cascade(label="Help", menu=help_menu)
-        
-        self.root.config(menu=menubar)
-        
+        ui_common.build_menu(self.root, (
+            ("File", (
+                ("Open ROM", self.open_rom, "Ctrl+O"),
+                ("Close ROM", self.close_rom),
+                None,
+                ("Save State", self.save_state),
+                ("Load State", self.load_state),
+                None,
+                ("Exit", self.root.quit),
+            )),
+            ("Emulation", (
+                ("Play", self.play_emu, "F5"),
+                ("Pause", self.pause_emu, "F6"),
+                ("Reset", self.reset_emu, "F7"),
+                None,
+                ("Fullscreen", self.toggle_fullscreen, "Alt+Enter"),
+            )),
+            ("Config", (
+                ("Input", self.config_input),
+                ("Video", self.config_video),
+                ("Sound", self.config_sound),
+            )),
+            ("Tools", (
+                ("Cheats", self.open_cheats),
+                ("Debugger", self.open_debugger),
+            )),
+            ("Help", (
+                ("About", self.show_about),
+            )),
+        ))
+
     def create_toolbar(self, parent):
-        toolbar = ttk.Frame(parent, height=40)
-        toolbar.pack(fill=tk.X, pady=(0, 5))
-        
-        # Toolbar buttons
-        buttons = [
-            ("Open", self.open_rom, "📁"),
-            ("Play", self.play_emu, "▶️"),
-            ("Pause", self.pause_emu, "⏸️"),
-            ("Reset", self.reset_emu, "🔄"),
-            ("Fullscreen", self.toggle_fullscreen, "⛶")
-        ]
-        
-        for text, command, icon in buttons:
-            btn = ttk.Button(toolbar, text=f"{icon} {text}", command=command)
-            btn.pack(side=tk.LEFT, padx=2)
-            
+        ui_common.build_toolbar(parent, (
+            ("📁 Open", self.open_rom),
+            ("▶️ Play", self.play_emu),
+            ("⏸️ Pause", self.pause_emu),
+            ("🔄 Reset", self.reset_emu),
+            ("⛶ Fullscreen", self.toggle_fullscreen),
+        ), style='Tool.TButton')
+
     def create_display_area(self, parent):
-        display_frame = ttk.LabelFrame(parent, text="Display", padding=10)
-        display_frame.pack(fill=tk.BOTH, expand=True, pady=5)
-        
-        # Game display area
-        self.display_canvas = tk.Canvas(
-            display_frame, 
-            bg='#000000', 
-            highlightthickness=1, 
-            highlightbackground='#555555'
-        )
-        self.display_canvas.pack(fill=tk.BOTH, expand=True)
-        
-        # Placeholder text with new branding
-        self.display_canvas.create_text(
-            400, 200, 
-            text="emunes 1.0\nTeam Flames\n\nNo ROM Loaded\nClick 'Open ROM' to load a game", 
-            fill='#666666', 
-            font=('Arial', 12), 
-            justify=tk.CENTER
-        )
+        _, self.display_canvas = ui_common.build_display(parent)
+
+        # Cache the raw Tcl interpreter handle and the canvas path name so
+        # redraws can skip Tkinter's Python-side option flattening.
+        self._tk = self.root.tk
+        self._cvs = self.display_canvas._w
+
+        # Pre-allocated 256x240 framebuffer surface: one image item on the
+        # canvas, one put() per presented frame once real rendering lands.
+        self.fb = tk.PhotoImage(width=256, height=240)
+        self.fb_item = self.display_canvas.create_image(128, 120, image=self.fb, anchor='nw')
+
+        # Create the status text item once; state changes only reconfigure it.
+        self._status_text_id = self._tk.call(
+            self._cvs, 'create', 'text', 400, 200,
+            '-text', "emunes 1.0\nTeam Flames\n\nNo ROM Loaded\nClick 'Open ROM' to load a game",
+            '-fill', '#666666', '-font', 'Arial 12', '-justify', 'center')
+
+    def _set_display(self, text, fill):
+        """Update the cached status text item in place — no delete/recreate."""
+        self._tk.call(self._cvs, 'itemconfigure', self._status_text_id,
+                      '-text', text, '-fill', fill)
+
+    def draw_overlay_line(self, coords, color):
+        """Draw a debug-overlay polyline from a coordinate sequence.
+
+        Pass coords already flat (e.g. array.array('i')) so _flatten is a
+        no-op; the points go to Tcl in one create call.
+        """
+        return self._tk.call(self._cvs, 'create', 'line',
+                             *_flatten(coords), '-fill', color)
+
+    def present_frame(self, ppm_bytes):
+        """Blit one frame into the framebuffer image.
+
+        ppm_bytes is a binary P6 PPM (header + raw RGB) built from the PPU
+        output buffer; Tk decodes it in a single photo put call.
+        """
+        self._tk.call(str(self.fb), 'put', ppm_bytes)
         
     def create_control_panel(self, parent):
         control_frame = ttk.Frame(parent)
@@ -149,16 +172,14 @@ class EmuNESGUI:
         ]
         
         for text, command in ctrl_buttons:
-            btn = ttk.Button(ctrl_frame, text=text, command=command)
+            btn = ttk.Button(ctrl_frame, text=text, command=command,
+                             style='Tool.TButton')
             btn.pack(fill=tk.X, pady=1)
             
     def create_status_bar(self):
-        status_frame = ttk.Frame(self.root, relief=tk.SUNKEN)
-        status_frame.pack(fill=tk.X, side=tk.BOTTOM)
-        
-        self.status_text = ttk.Label(status_frame, text="Ready - emunes 1.0 [C] Team Flames")
-        self.status_text.pack(side=tk.LEFT, padx=5)
-        
+        status_frame, self.status_text = ui_common.build_statusbar(
+            self.root, "Ready - emunes 1.0 [C] Team Flames")
+
         # FPS counter
         self.fps_label = ttk.Label(status_frame, text="FPS: --")
         self.fps_label.pack(side=tk.RIGHT, padx=5)
@@ -181,6 +202,11 @@ Actual emulation core would be integrated separately."""
         
     # Menu functions
     def open_rom(self):
+        # Run the native dialog off the Tk thread so the mainloop keeps
+        # processing events while it is up.
+        threading.Thread(target=self._pick_rom, daemon=True).start()
+
+    def _pick_rom(self):
         file_path = filedialog.askopenfilename(
             title="Open NES ROM - emunes 1.0",
             filetypes=[
@@ -188,21 +214,18 @@ Actual emulation core would be integrated separately."""
                 ("All files", "*.*")
             ]
         )
-        
+        if file_path:
+            # Marshal UI updates back onto the Tk thread
+            self.root.after(0, self._finish_open_rom, file_path)
+
+    def _finish_open_rom(self, file_path):
         if file_path:
             self.rom_path = file_path
             self.rom_loaded = True
             filename = os.path.basename(file_path)
             
             # Update display
-            self.display_canvas.delete("all")
-            self.display_canvas.create_text(
-                400, 200, 
-                text=f"emunes 1.0\nTeam Flames\n\nROM Loaded:\n{filename}\n\nClick 'Play' to start", 
-                fill='#00ff00', 
-                font=('Arial', 12), 
-                justify=tk.CENTER
-            )
+            self._set_display(f"emunes 1.0\nTeam Flames\n\nROM Loaded:\n{filename}\n\nClick 'Play' to start", '#00ff00')
             
             # Update ROM info
             self.rom_info_text.config(state=tk.NORMAL)
@@ -211,8 +234,8 @@ Actual emulation core would be integrated separately."""
             self.rom_info_text.config(state=tk.DISABLED)
             
             # Update status
-            self.rom_status.config(text=f"ROM: {filename}")
-            self.status_text.config(text="ROM loaded successfully - emunes 1.0")
+            self._set_label(self.rom_status, f"ROM: {filename}")
+            self._set_label(self.status_text, "ROM loaded successfully - emunes 1.0")
             
     def close_rom(self):
         if self.rom_loaded:
@@ -221,14 +244,7 @@ Actual emulation core would be integrated separately."""
             self.rom_path = None
             
             # Reset display
-            self.display_canvas.delete("all")
-            self.display_canvas.create_text(
-                400, 200, 
-                text="emunes 1.0\nTeam Flames\n\nNo ROM Loaded\nClick 'Open ROM' to load a game", 
-                fill='#666666', 
-                font=('Arial', 12), 
-                justify=tk.CENTER
-            )
+            self._set_display("emunes 1.0\nTeam Flames\n\nNo ROM Loaded\nClick 'Open ROM' to load a game", '#666666')
             
             # Reset ROM info
             self.rom_info_text.config(state=tk.NORMAL)
@@ -236,50 +252,29 @@ Actual emulation core would be integrated separately."""
             self.rom_info_text.insert(tk.END, "No ROM loaded")
             self.rom_info_text.config(state=tk.DISABLED)
             
-            self.rom_status.config(text="No ROM")
-            self.status_text.config(text="ROM closed - emunes 1.0")
+            self._set_label(self.rom_status, "No ROM")
+            self._set_label(self.status_text, "ROM closed - emunes 1.0")
             
     def play_emu(self):
         if self.rom_loaded and not self.is_playing:
             self.is_playing = True
-            self.display_canvas.delete("all")
-            self.display_canvas.create_text(
-                400, 200, 
-                text="emunes 1.0\nTeam Flames\n\nGame Playing\n(Press Pause to stop)", 
-                fill='#00ff00', 
-                font=('Arial', 12), 
-                justify=tk.CENTER
-            )
-            self.status_text.config(text="Emulation running - emunes 1.0")
-            self.fps_label.config(text="FPS: 60")
+            self._set_display("emunes 1.0\nTeam Flames\n\nGame Playing\n(Press Pause to stop)", '#00ff00')
+            self._set_label(self.status_text, "Emulation running - emunes 1.0")
+            self._set_label(self.fps_label, "FPS: 60")
             
     def pause_emu(self):
         if self.is_playing:
             self.is_playing = False
-            self.display_canvas.delete("all")
-            self.display_canvas.create_text(
-                400, 200, 
-                text="emunes 1.0\nTeam Flames\n\nGame Paused\n(Press Play to continue)", 
-                fill='#ffff00', 
-                font=('Arial', 12), 
-                justify=tk.CENTER
-            )
-            self.status_text.config(text="Emulation paused - emunes 1.0")
-            self.fps_label.config(text="FPS: --")
+            self._set_display("emunes 1.0\nTeam Flames\n\nGame Paused\n(Press Play to continue)", '#ffff00')
+            self._set_label(self.status_text, "Emulation paused - emunes 1.0")
+            self._set_label(self.fps_label, "FPS: --")
             
     def reset_emu(self):
         if self.rom_loaded:
             self.is_playing = False
-            self.display_canvas.delete("all")
-            self.display_canvas.create_text(
-                400, 200, 
-                text="emunes 1.0\nTeam Flames\n\nGame Reset\n(Press Play to start)", 
-                fill='#ff9900', 
-                font=('Arial', 12), 
-                justify=tk.CENTER
-            )
-            self.status_text.config(text="Emulation reset - emunes 1.0")
-            self.fps_label.config(text="FPS: --")
+            self._set_display("emunes 1.0\nTeam Flames\n\nGame Reset\n(Press Play to start)", '#ff9900')
+            self._set_label(self.status_text, "Emulation reset - emunes 1.0")
+            self._set_label(self.fps_label, "FPS: --")
             
     def toggle_fullscreen(self):
         messagebox.showinfo("Fullscreen", "Fullscreen mode would be activated here")
@@ -309,15 +304,15 @@ Actual emulation core would be integrated separately."""
         
     def quick_save(self, slot):
         if self.rom_loaded:
-            self.status_text.config(text=f"Quick save to slot {slot} - emunes 1.0")
+            self._set_label(self.status_text, f"Quick save to slot {slot} - emunes 1.0")
             
     def quick_load(self, slot):
         if self.rom_loaded:
-            self.status_text.config(text=f"Quick load from slot {slot} - emunes 1.0")
+            self._set_label(self.status_text, f"Quick load from slot {slot} - emunes 1.0")
             
     def take_screenshot(self):
         if self.rom_loaded:
-            self.status_text.config(text="Screenshot saved - emunes 1.0")
+            self._set_label(self.status_text, "Screenshot saved - emunes 1.0")
 
 def main():
     root = tk.Tk()
@@ -2,76 +2,304 @@
 # emunes-tk.py – Minimal NES Emulator Core with Tkinter frontend
 import sys
 import os
+import mmap
+import struct
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext
 
+import ui_common
+
 # ==============================
 # CPU 6502 Core
 # ==============================
+# Status register bit positions (NV-BDIZC), as on real hardware.
+FLAG_BITS = {'C':0x01,'Z':0x02,'I':0x04,'D':0x08,'B':0x10,'U':0x20,'V':0x40,'N':0x80}
+
+# Blocks hit more often than this get compiled to a dedicated function.
+BLOCK_PROMOTE_THRESHOLD = 16
+# Cap recorded trace length so a pathological ROM can't build huge blocks.
+BLOCK_MAX_OPS = 64
+
 class CPU6502:
+    # Fixed attribute set: slot-offset access instead of per-instance
+    # __dict__ probes in the interpreter loop.
+    __slots__ = ('A','X','Y','SP','PC','P','memory','optable','_invalid',
+                 'block_cache','block_hits','block_span','code_page_dirty')
+
     def __init__(self, memory):
         self.A = 0x00
         self.X = 0x00
         self.Y = 0x00
         self.SP = 0xFD
         self.PC = 0x0000
-        self.flags = {'C':0,'Z':0,'I':0,'D':0,'B':0,'U':1,'V':0,'N':0}
+        self.P = 0x24  # packed status byte (U=1, I=1), replaces the flags dict
         self.memory = memory
+        # 256-entry dispatch table: one indexed call per instruction
+        # instead of an if/elif ladder over every known opcode.
+        # Bind the invalid handler once — attribute access would make a
+        # fresh bound method each time, breaking identity checks against
+        # the table entries.
+        self._invalid = self._op_invalid
+        self.optable = [self._invalid]*256
+        self.optable[0xA9] = self._lda_imm
+        self.optable[0xA2] = self._ldx_imm
+        self.optable[0xE8] = self._inx
+        self.optable[0x00] = self._brk
+        # Straight-line traces keyed by start PC; hot ones get compiled.
+        self.block_cache = {}
+        self.block_hits = Counter()
+        # Page span covered by each cached block, and a 256-bit dirty map
+        # (one flag per 256-byte page) checked lazily on block reuse.
+        self.block_span = {}
+        self.code_page_dirty = bytearray(256)
 
-    def set_flag(self, f, c): self.flags[f] = 1 if c else 0
-    def update_zn(self, v): self.set_flag('Z', v==0); self.set_flag('N', v & 0x80)
+    def set_flag(self, f, c):
+        bit = FLAG_BITS[f]
+        self.P = (self.P | bit) if c else (self.P & ~bit)
+    def get_flag(self, f): return 1 if self.P & FLAG_BITS[f] else 0
+    def update_zn(self, v):
+        self.P = (self.P & ~0x82) | (0x02 if v==0 else 0) | (v & 0x80)
 
     def reset(self):
         lo,hi = self.memory[0xFFFC], self.memory[0xFFFD]
         self.PC = (hi<<8)|lo
 
+    # --- opcode handlers: read operands, update state, return True to continue ---
+    def _lda_imm(self):  # LDA #
+        self.A=self.memory[self.PC]; self.PC+=1
+        self.update_zn(self.A); return True
+
+    def _ldx_imm(self):  # LDX #
+        self.X=self.memory[self.PC]; self.PC+=1
+        self.update_zn(self.X); return True
+
+    def _inx(self):  # INX
+        self.X=(self.X+1)&0xFF; self.update_zn(self.X); return True
+
+    def _brk(self):  # BRK
+        return False
+
+    def _op_invalid(self):
+        print(f"Unknown opcode {self.memory[(self.PC-1)&0xFFFF]:02X}"); return False
+
+    def _write(self, addr, v):
+        """Memory write for store opcodes: marks the page dirty so cached
+        blocks through it get invalidated. PRG-ROM (0x8000+) ignores writes,
+        so those pages stay permanently clean."""
+        addr &= 0xFFFF
+        if addr >= 0x8000:
+            return
+        self.memory[addr] = v & 0xFF
+        self.code_page_dirty[addr>>8] = 1
+
     def step(self):
         opcode = self.memory[self.PC]; self.PC+=1
-        if opcode == 0xA9:  # LDA #
-            v=self.memory[self.PC]; self.PC+=1
-            self.A=v; self.update_zn(self.A)
-        elif opcode == 0xA2:  # LDX #
-            v=self.memory[self.PC]; self.PC+=1
-            self.X=v; self.update_zn(self.X)
-        elif opcode == 0xE8:  # INX
-            self.X=(self.X+1)&0xFF; self.update_zn(self.X)
-        elif opcode == 0x00:  # BRK
-            return False
+        return self.optable[opcode]()
+
+    # --- codeblock cache: record, replay, and promote straight-line traces ---
+    def step_block(self):
+        """Execute one straight-line block starting at the current PC.
+
+        First visit interprets and records the trace up to the next halting
+        opcode; later visits replay the cached trace, and blocks hit more
+        than BLOCK_PROMOTE_THRESHOLD times are compiled via exec() into a
+        dedicated function. Returns False once execution halts.
+        """
+        pc = self.PC
+        cached = self.block_cache.get(pc)
+        if cached is None:
+            return self._record_block(pc)
+        p0, p1 = self.block_span[pc]
+        if any(self.code_page_dirty[p] for p in range(p0, p1+1)):
+            self._invalidate_dirty_pages(p0, p1)
+            return self._record_block(pc)
+        self.block_hits[pc] += 1
+        if not callable(cached) and self.block_hits[pc] > BLOCK_PROMOTE_THRESHOLD:
+            cached = self._compile_block(pc, cached)
+            self.block_cache[pc] = cached
+        if callable(cached):
+            return cached(self)
+        return self._replay_block(cached)
+
+    def _record_block(self, start_pc):
+        ops = []
+        term = None
+        ok = True
+        while True:
+            op = self.memory[self.PC]
+            if op == 0x00 or self.optable[op] is self._invalid:
+                self.PC += 1
+                ok = self.optable[op]()
+                term = op
+                break
+            operand = self.memory[(self.PC+1)&0xFFFF]
+            ok = self.step()
+            if not ok:
+                # Handler halted mid-trace: record it as the terminator so
+                # replayed and compiled runs halt at the same point.
+                term = op
+                break
+            ops.append((op, operand))
+            if len(ops) >= BLOCK_MAX_OPS:
+                break
+        self.block_cache[start_pc] = (tuple(ops), term)
+        self.block_span[start_pc] = (start_pc>>8, ((self.PC-1)&0xFFFF)>>8)
+        self.block_hits[start_pc] = 1
+        return ok
+
+    def _invalidate_dirty_pages(self, p0, p1):
+        """Drop every cached block touching a dirty page in [p0, p1], then
+        clear those dirty bits."""
+        dirty = [p for p in range(p0, p1+1) if self.code_page_dirty[p]]
+        stale = [start for start, (q0, q1) in self.block_span.items()
+                 if any(q0 <= p <= q1 for p in dirty)]
+        for start in stale:
+            self.block_cache.pop(start, None)
+            self.block_span.pop(start, None)
+            self.block_hits.pop(start, None)
+        for p in dirty:
+            self.code_page_dirty[p] = 0
+
+    def _replay_block(self, trace):
+        ops, term = trace
+        A, X, PC, P = self.A, self.X, self.PC, self.P
+        for op, operand in ops:
+            if op == 0xA9:    # LDA #
+                A = operand; PC += 2
+                P = (P & ~0x82) | (0x02 if A==0 else 0) | (A & 0x80)
+            elif op == 0xA2:  # LDX #
+                X = operand; PC += 2
+                P = (P & ~0x82) | (0x02 if X==0 else 0) | (X & 0x80)
+            elif op == 0xE8:  # INX
+                X = (X+1)&0xFF; PC += 1
+                P = (P & ~0x82) | (0x02 if X==0 else 0) | (X & 0x80)
+        self.A, self.X, self.PC, self.P = A, X, PC, P
+        if term is None:
+            return True
+        self.PC += 1
+        return self.optable[term]()
+
+    def _compile_block(self, start_pc, trace):
+        """Promote a hot trace: exec() a function with the handler bodies inlined.
+
+        Immediate operands are constants in the trace, so their Z/N flag
+        contributions are folded at compile time.
+        """
+        ops, term = trace
+        lines = ["def _block(cpu):", "    A=cpu.A; X=cpu.X; P=cpu.P"]
+        pc = start_pc
+        for op, operand in ops:
+            if op == 0xA9:    # LDA #
+                zn = (0x02 if operand==0 else 0) | (operand & 0x80)
+                lines.append(f"    A=0x{operand:02X}; P=(P&~0x82)|0x{zn:02X}")
+                pc += 2
+            elif op == 0xA2:  # LDX #
+                zn = (0x02 if operand==0 else 0) | (operand & 0x80)
+                lines.append(f"    X=0x{operand:02X}; P=(P&~0x82)|0x{zn:02X}")
+                pc += 2
+            elif op == 0xE8:  # INX
+                lines.append("    X=(X+1)&0xFF; P=(P&~0x82)|(0x02 if X==0 else 0)|(X&0x80)")
+                pc += 1
+        lines.append(f"    cpu.A=A; cpu.X=X; cpu.P=P; cpu.PC=0x{pc:04X}")
+        if term is None:
+            lines.append("    return True")
         else:
-            print(f"Unknown opcode {opcode:02X}"); return False
-        return True
+            lines.append(f"    cpu.PC=0x{pc+1:04X}")
+            lines.append(f"    return cpu.optable[0x{term:02X}]()")
+        ns = {}
+        exec("\n".join(lines), ns)
+        return ns["_block"]
+
+    def run_n(self, n):
+        """Run up to n instructions in one call.
+
+        Hot opcodes are inlined over local copies of the registers so a
+        whole batch pays one attribute sync instead of per-instruction
+        attribute/dict traffic; anything not inlined falls back to the
+        dispatch table. Returns False once BRK or an invalid opcode halts.
+        """
+        mem = self.memory
+        A, X, PC, P = self.A, self.X, self.PC, self.P
+        ok = True
+        for _ in range(n):
+            op = mem[PC]; PC += 1
+            if op == 0xA9:    # LDA #
+                A = mem[PC]; PC += 1
+                P = (P & ~0x82) | (0x02 if A==0 else 0) | (A & 0x80)
+            elif op == 0xA2:  # LDX #
+                X = mem[PC]; PC += 1
+                P = (P & ~0x82) | (0x02 if X==0 else 0) | (X & 0x80)
+            elif op == 0xE8:  # INX
+                X = (X+1)&0xFF
+                P = (P & ~0x82) | (0x02 if X==0 else 0) | (X & 0x80)
+            elif op == 0x00:  # BRK
+                ok = False; break
+            else:
+                # Sync state, let the table handle it, then re-hoist.
+                self.A, self.X, self.PC, self.P = A, X, PC, P
+                ok = self.optable[op]()
+                A, X, PC, P = self.A, self.X, self.PC, self.P
+                if not ok: break
+        self.A, self.X, self.PC, self.P = A, X, PC, P
+        return ok
 
 # ==============================
 # NES ROM Loader
 # ==============================
 def load_nes_rom(path, memory):
+    # mmap the ROM so PRG data is copied straight from the page cache
+    # into memory with no intermediate bytes objects.
     with open(path, "rb") as f:
-        data = f.read()
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            # One unpack call reads the whole header
+            magic, prg_banks, chr_banks = struct.unpack_from('<4sBB', mm, 0)
+            if magic != b"NES\x1A":
+                raise ValueError("Not a valid iNES ROM")
 
-    if data[0:4] != b"NES\x1A":
-        raise ValueError("Not a valid iNES ROM")
+            prg_size = prg_banks * 16 * 1024   # PRG ROM size
+            chr_size = chr_banks * 8 * 1024    # CHR ROM size (ignored for now)
 
-    prg_size = data[4] * 16 * 1024   # PRG ROM size
-    chr_size = data[5] * 8 * 1024    # CHR ROM size (ignored for now)
+            # No mapper support yet: more than 32KB of PRG cannot fit the
+            # 0x8000-0xFFFF window, and slice-assigning past it would grow
+            # the 64KiB memory buffer.
+            if prg_size > 0x8000:
+                raise ValueError(
+                    f"Unsupported PRG size {prg_size} bytes (no mapper support)")
 
-    prg_start = 16
-    prg_data = data[prg_start:prg_start+prg_size]
+            # A short file would make the slice below shrink memory
+            # instead of filling it — reject it before touching the buffer.
+            if len(mm) < 16 + prg_size:
+                raise ValueError(
+                    f"Truncated ROM: header declares {prg_size} bytes of PRG, "
+                    f"file has {len(mm)-16}")
 
-    # Map PRG-ROM into 0x8000-0xFFFF
-    for i,b in enumerate(prg_data):
-        memory[0x8000+i] = b
+            # Map PRG-ROM into 0x8000-0xFFFF (single memcpy, no per-byte loop)
+            memory[0x8000:0x8000+prg_size] = mm[16:16+prg_size]
 
-    # If only 16KB PRG, mirror it into 0xC000-0xFFFF
-    if prg_size == 16384:
-        for i in range(16384):
-            memory[0xC000+i] = prg_data[i]
+            # If only 16KB PRG, mirror it into 0xC000-0xFFFF — one
+            # in-buffer memcpy, no second read of the mapped file
+            if prg_size == 16384:
+                memory[0xC000:0x10000] = memory[0x8000:0xC000]
+        finally:
+            mm.close()
 
     # Set reset vector to PRG-ROM start if not provided
     if memory[0xFFFC] == 0 and memory[0xFFFD] == 0:
         memory[0xFFFC] = 0x00
         memory[0xFFFD] = 0x80
 
-    return len(prg_data)
+    return prg_size
+
+# ==============================
+# Save states
+# ==============================
+STATE_MAGIC = b'NESS1'
+# registers after the magic: A, X, Y, SP, P, PC
+STATE_REGS = struct.Struct('<BBBBBH')
 
 # ==============================
 # Emulator GUI
@@ -79,26 +307,42 @@ def load_nes_rom(path, memory):
 class EmuNESApp:
     def __init__(self, root):
         self.root=root; self.root.title("emunes 1.0 - NES Core Demo")
-        self.memory=[0x00]*65536
+        self.memory=bytearray(65536)  # flat bytes, not a list of boxed ints
         self.cpu=CPU6502(self.memory)
         self.running=False
+        self._pending_log=[]  # lines buffered here, flushed in one insert
+        self._last_reg_txt=None  # skip pane rebuild when registers unchanged
+        # Single worker runs CPU batches so the Tk thread never blocks on them
+        self._cpu_executor=ThreadPoolExecutor(max_workers=1)
         self.create_gui()
 
+    def log_line(self, line):
+        self._pending_log.append(line)
+
+    def flush_log(self):
+        if self._pending_log:
+            self.log.insert(tk.END, "\n".join(self._pending_log)+"\n")
+            self._pending_log.clear()
+
     def create_gui(self):
-        menubar=tk.Menu(self.root)
-        filemenu=tk.Menu(menubar,tearoff=0)
-        filemenu.add_command(label="Open ROM (.nes)",command=self.open_rom)
-        filemenu.add_separator()
-        filemenu.add_command(label="Exit",command=self.root.quit)
-        menubar.add_cascade(label="File",menu=filemenu)
-        self.root.config(menu=menubar)
-
-        top=ttk.Frame(self.root); top.pack(fill=tk.X,padx=5,pady=5)
-        mid=ttk.Frame(self.root); mid.pack(fill=tk.BOTH,expand=True,padx=5,pady=5)
+        ui_common.build_menu(self.root, (
+            ("File", (
+                ("Open ROM (.nes)", self.open_rom),
+                None,
+                ("Save State", self.save_state_dialog),
+                ("Load State", self.load_state_dialog),
+                None,
+                ("Exit", self.root.quit),
+            )),
+        ))
+
+        ui_common.build_toolbar(self.root, (
+            ("Reset", self.reset),
+            ("Step", self.step),
+            ("Run 20 instr", self.run20),
+        ))
 
-        ttk.Button(top,text="Reset",command=self.reset).pack(side=tk.LEFT,padx=5)
-        ttk.Button(top,text="Step",command=self.step).pack(side=tk.LEFT,padx=5)
-        ttk.Button(top,text="Run 20 instr",command=self.run20).pack(side=tk.LEFT,padx=5)
+        mid=ttk.Frame(self.root); mid.pack(fill=tk.BOTH,expand=True,padx=5,pady=5)
 
         self.reg_text=tk.Text(mid,width=30,height=15,bg="#1a1a1a",fg="#00ff00",font=("Courier",10))
         self.reg_text.pack(side=tk.LEFT,fill=tk.Y)
@@ -108,9 +352,16 @@ class EmuNESApp:
         self.update_registers()
 
     def open_rom(self):
+        # Keep the mainloop responsive while the native dialog is up.
+        threading.Thread(target=self._pick_rom, daemon=True).start()
+
+    def _pick_rom(self):
         path=filedialog.askopenfilename(title="Open NES ROM",
                                         filetypes=[("NES ROMs","*.nes"),("All files","*.*")])
-        if not path: return
+        if path:
+            self.root.after(0, self._finish_open_rom, path)
+
+    def _finish_open_rom(self, path):
         try:
             size=load_nes_rom(path, self.memory)
             self.cpu.reset()
@@ -119,33 +370,119 @@ class EmuNESApp:
         except Exception as e:
             self.log.insert(tk.END,f"Error loading ROM: {e}\n")
 
+    def save_state(self, path):
+        """Write a compact binary snapshot: magic + packed registers + memory."""
+        cpu=self.cpu
+        with open(path,'wb') as f:
+            f.write(STATE_MAGIC)
+            f.write(STATE_REGS.pack(cpu.A,cpu.X,cpu.Y,cpu.SP,cpu.P,cpu.PC))
+            f.write(bytes(self.memory))
+
+    def load_state(self, path):
+        """Restore a snapshot written by save_state (zero-copy via mmap)."""
+        with open(path,'rb') as f:
+            mm=mmap.mmap(f.fileno(),0,access=mmap.ACCESS_READ)
+            try:
+                if mm[:len(STATE_MAGIC)]!=STATE_MAGIC:
+                    raise ValueError("Not an emunes save state")
+                off=len(STATE_MAGIC)+STATE_REGS.size
+                if len(mm)-off!=len(self.memory):
+                    raise ValueError("Corrupt save state: wrong memory size")
+                cpu=self.cpu
+                (cpu.A,cpu.X,cpu.Y,cpu.SP,cpu.P,cpu.PC)=STATE_REGS.unpack_from(mm,len(STATE_MAGIC))
+                self.memory[:]=mm[off:]
+            finally:
+                mm.close()
+        # Memory contents changed wholesale; cached traces are stale.
+        cpu.block_cache.clear(); cpu.block_span.clear(); cpu.block_hits.clear()
+
+    def save_state_dialog(self):
+        threading.Thread(target=self._pick_save_state, daemon=True).start()
+
+    def _pick_save_state(self):
+        path=filedialog.asksaveasfilename(title="Save State",defaultextension=".ness",
+                                          filetypes=[("emunes states","*.ness"),("All files","*.*")])
+        if path:
+            self.root.after(0, self._finish_state_io, self.save_state, path, "State saved")
+
+    def load_state_dialog(self):
+        threading.Thread(target=self._pick_load_state, daemon=True).start()
+
+    def _pick_load_state(self):
+        path=filedialog.askopenfilename(title="Load State",
+                                        filetypes=[("emunes states","*.ness"),("All files","*.*")])
+        if path:
+            self.root.after(0, self._finish_state_io, self.load_state, path, "State loaded")
+
+    def _finish_state_io(self, op, path, msg):
+        try:
+            op(path)
+            self.log_line(f"{msg}: {os.path.basename(path)}")
+        except Exception as e:
+            self.log_line(f"State error: {e}")
+        self.flush_log()
+        self.update_registers()
+
+    def _submit_cpu(self, fn, *args, done):
+        """Run a CPU mutation on the worker, then call done(result) on Tk.
+
+        Every CPU state change goes through the single-worker executor, so
+        a manual Step/Reset can never race the register writeback of a
+        batch still running there. The future is resolved on the Tk thread
+        so worker exceptions land in the log instead of vanishing inside
+        the done callback.
+        """
+        def _finish(f):
+            try:
+                result=f.result()
+            except Exception as e:
+                self.log_line(f"CPU error: {e}")
+                self.flush_log()
+                return
+            done(result)
+        future=self._cpu_executor.submit(fn,*args)
+        future.add_done_callback(lambda f: self.root.after(0,_finish,f))
+
     def reset(self):
-        self.cpu.reset()
+        self._submit_cpu(self.cpu.reset, done=self._on_reset_done)
+
+    def _on_reset_done(self, _):
         self.log.insert(tk.END,"CPU reset\n")
         self.update_registers()
 
     def step(self):
-        ok=self.cpu.step()
-        self.log.insert(tk.END,f"Step: PC={self.cpu.PC:04X} A={self.cpu.A:02X} X={self.cpu.X:02X}\n")
-        self.update_registers()
+        self._submit_cpu(self.cpu.step, done=self._on_step_done)
+
+    def _on_step_done(self, ok):
+        self.log_line(f"Step: PC={self.cpu.PC:04X} A={self.cpu.A:02X} X={self.cpu.X:02X}")
         if not ok:
-            self.log.insert(tk.END,"Execution stopped (BRK or invalid)\n")
+            self.log_line("Execution stopped (BRK or invalid)")
+        self.flush_log()
+        self.update_registers()
 
     def run20(self):
-        for _ in range(20):
-            if not self.cpu.step():
-                break
-        self.log.insert(tk.END,"Ran 20 steps\n")
+        # Run the batch on the worker; completion is marshalled back onto
+        # the Tk thread, which only repaints.
+        self._submit_cpu(self.cpu.run_n, 20, done=self._on_batch_done)
+
+    def _on_batch_done(self, ok):
+        self.log_line("Ran 20 steps")
+        if not ok:
+            self.log_line("Execution stopped (BRK or invalid)")
+        self.flush_log()
         self.update_registers()
 
     def update_registers(self):
-        self.reg_text.config(state=tk.NORMAL)
-        self.reg_text.delete(1.0,tk.END)
         r=self.cpu
         txt=f"""A={r.A:02X} X={r.X:02X} Y={r.Y:02X}
 SP={r.SP:02X}  PC={r.PC:04X}
-Flags: C{r.flags['C']} Z{r.flags['Z']} I{r.flags['I']} D{r.flags['D']}
-       B{r.flags['B']} U{r.flags['U']} V{r.flags['V']} N{r.flags['N']}"""
+Flags: C{r.get_flag('C')} Z{r.get_flag('Z')} I{r.get_flag('I')} D{r.get_flag('D')}
+       B{r.get_flag('B')} U{r.get_flag('U')} V{r.get_flag('V')} N{r.get_flag('N')}"""
+        if txt==self._last_reg_txt:
+            return
+        self._last_reg_txt=txt
+        self.reg_text.config(state=tk.NORMAL)
+        self.reg_text.delete(1.0,tk.END)
         self.reg_text.insert(tk.END,txt)
         self.reg_text.config(state=tk.DISABLED)
 
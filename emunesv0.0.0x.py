@@ -1,9 +1,70 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+import contextlib
 import os
-import time
-import random
-from datetime import datetime
+from enum import IntEnum
+
+class PPUReg(IntEnum):
+    """Index into the packed PPU register file"""
+    PPUCTRL = 0
+    PPUMASK = 1
+    PPUSTATUS = 2
+    OAMADDR = 3
+    PPUSCROLL = 4
+    PPUADDR = 5
+    PPUDATA = 6
+
+class APUReg(IntEnum):
+    """Index into the packed APU register file"""
+    SQ1_VOL = 0
+    SQ1_SWEEP = 1
+    SQ1_LO = 2
+    SQ1_HI = 3
+    SQ2_VOL = 4
+    SQ2_SWEEP = 5
+    TRI_LINEAR = 6
+    TRI_LO = 7
+    NOISE_VOL = 8
+    DMC_FREQ = 9
+    APU_STATUS = 10
+
+# Status messages returned by the initialize_* steps — single shared
+# instances, nothing rebuilt per call
+_MSG_PPU_INIT = "PPU: VRAM cleared, palettes initialized, sprites reset"
+_MSG_APU_INIT = "APU: Channels muted, timers reset, DMC disabled"
+_MSG_CPU_INIT = "CPU: Registers cleared, stack pointer at 0xFD, reset vector set"
+_MSG_MEM_INIT = "Memory: 2KB RAM cleared, VRAM initialized, zero page configured"
+_MSG_CTRL_INIT = "Controllers: Ports 1&2 initialized, strobe mode set"
+
+# Fixed GUI lists — shared tuples, not rebuilt on every panel build
+_HW_COMPONENTS = ('PPU', 'APU', 'CPU', 'Memory', 'Controllers', 'BIOS')
+_SPECS = (
+    "CPU: MOS 6502 @ 1.79MHz",
+    "PPU: RP2C02 @ 5.37MHz",
+    "APU: 5-channel sound",
+    "Memory: 2KB RAM + 2KB VRAM",
+)
+
+# Quick-control buttons: (label, GUI method name), bound per instance
+_QUICK_CTRLS = (
+    ('Open ROM', 'open_rom'),
+    ('Run BIOS', 'run_bios'),
+    ('Hardware Test', 'hardware_test'),
+)
+
+# Fixed tail of the BIOS log — diagnostics block and completion banner
+_BIOS_DIAG_TAIL = (
+    "",
+    "6. System Diagnostics...",
+    "   RAM: 2KB OK",
+    "   VRAM: 2KB OK",
+    "   CPU: 6502 1.79MHz OK",
+    "   PPU: RP2C02 5.37MHz OK",
+    "   APU: 5 Channels OK",
+    "",
+    "=== BIOS Complete ===",
+    "System ready for ROM loading",
+)
 
 class NESHardware:
     """Proof-of-concept NES hardware simulation"""
@@ -16,140 +77,127 @@ class NESHardware:
         self.controllers_initialized = False
         self.bios_complete = False
         
-        # PPU Registers
-        self.ppu_registers = {
-            'PPUCTRL': 0x00,
-            'PPUMASK': 0x00,
-            'PPUSTATUS': 0x00,
-            'OAMADDR': 0x00,
-            'PPUSCROLL': 0x00,
-            'PPUADDR': 0x00,
-            'PPUDATA': 0x00
-        }
-        
-        # APU Registers
-        self.apu_registers = {
-            'SQ1_VOL': 0x00,
-            'SQ1_SWEEP': 0x00,
-            'SQ1_LO': 0x00,
-            'SQ1_HI': 0x00,
-            'SQ2_VOL': 0x00,
-            'SQ2_SWEEP': 0x00,
-            'TRI_LINEAR': 0x00,
-            'TRI_LO': 0x00,
-            'NOISE_VOL': 0x00,
-            'DMC_FREQ': 0x00,
-            'APU_STATUS': 0x00
-        }
-        
-        # Memory
-        self.ram = [0x00] * 2048  # 2KB RAM
-        self.vram = [0x00] * 2048  # Video RAM
+        # Register files — packed byte buffers indexed by the IntEnums,
+        # no string hashing or boxed ints per access
+        self.ppu_registers = bytearray(len(PPUReg))
+        self.apu_registers = bytearray(len(APUReg))
         
+        # Memory — flat byte buffers, not lists of boxed ints
+        self.ram = bytearray(2048)  # 2KB RAM
+        self.vram = bytearray(2048)  # Video RAM
+
+        # Set when register contents change; lets viewers cache their dumps
+        self.regs_dirty = True
+        
+    def reset(self):
+        """Reset all hardware state in place — reuses the existing buffers
+        instead of reallocating a whole NESHardware"""
+        self.ppu_initialized = False
+        self.apu_initialized = False
+        self.cpu_initialized = False
+        self.memory_initialized = False
+        self.controllers_initialized = False
+        self.bios_complete = False
+        self.ppu_registers[:] = bytes(len(self.ppu_registers))
+        self.apu_registers[:] = bytes(len(self.apu_registers))
+        self.ram[:] = bytes(len(self.ram))
+        self.vram[:] = bytes(len(self.vram))
+        self.regs_dirty = True
+
     def initialize_ppu(self):
         """Initialize Picture Processing Unit"""
-        self.ppu_registers['PPUCTRL'] = 0x80
-        self.ppu_registers['PPUMASK'] = 0x06
-        self.ppu_registers['PPUSTATUS'] = 0xA0
+        self.ppu_registers[PPUReg.PPUCTRL] = 0x80
+        self.ppu_registers[PPUReg.PPUMASK] = 0x06
+        self.ppu_registers[PPUReg.PPUSTATUS] = 0xA0
         self.ppu_initialized = True
-        return "PPU: VRAM cleared, palettes initialized, sprites reset"
+        self.regs_dirty = True
+        return _MSG_PPU_INIT
     
     def initialize_apu(self):
         """Initialize Audio Processing Unit"""
-        self.apu_registers['APU_STATUS'] = 0x0F
-        self.apu_registers['SQ1_VOL'] = 0x30
-        self.apu_registers['SQ2_VOL'] = 0x30
+        self.apu_registers[APUReg.APU_STATUS] = 0x0F
+        self.apu_registers[APUReg.SQ1_VOL] = 0x30
+        self.apu_registers[APUReg.SQ2_VOL] = 0x30
         self.apu_initialized = True
-        return "APU: Channels muted, timers reset, DMC disabled"
+        self.regs_dirty = True
+        return _MSG_APU_INIT
     
     def initialize_cpu(self):
         """Initialize 6502 CPU"""
-        # Reset vector at 0xFFFC
-        self.ram[0x1FFC] = 0x00  # Low byte of reset vector
-        self.ram[0x1FFD] = 0xC0  # High byte of reset vector
+        # Reset vector at 0xFFFC (mirrored into the 2KB window like real RAM)
+        self.ram[0x1FFC & 0x7FF] = 0x00  # Low byte of reset vector
+        self.ram[0x1FFD & 0x7FF] = 0xC0  # High byte of reset vector
         self.cpu_initialized = True
-        return "CPU: Registers cleared, stack pointer at 0xFD, reset vector set"
+        return _MSG_CPU_INIT
     
     def initialize_memory(self):
         """Initialize memory banks"""
-        # Clear RAM
-        for i in range(len(self.ram)):
-            self.ram[i] = 0x00
-            
-        # Clear VRAM
-        for i in range(len(self.vram)):
-            self.vram[i] = 0x00
-            
+        # Clear RAM and VRAM — single C-level memset each, no Python loop
+        self.ram[:] = bytes(len(self.ram))
+        self.vram[:] = bytes(len(self.vram))
+
         # Set up zero page and stack area
         self.ram[0x0000] = 0xFF  # IO ports
         self.ram[0x0001] = 0xFF
         self.memory_initialized = True
-        return "Memory: 2KB RAM cleared, VRAM initialized, zero page configured"
+        return _MSG_MEM_INIT
     
     def initialize_controllers(self):
         """Initialize game controllers"""
         self.controllers_initialized = True
-        return "Controllers: Ports 1&2 initialized, strobe mode set"
+        return _MSG_CTRL_INIT
     
     def run_bios(self):
-        """Run full BIOS initialization sequence"""
-        bios_log = []
-        bios_log.append("=== NES BIOS Initialization ===")
-        bios_log.append(f"Time: {datetime.now().strftime('%H:%M:%S')}")
-        bios_log.append("")
-        
+        """Run full BIOS initialization sequence.
+
+        Generator: yields one block of log lines per step so the GUI can
+        pace the display with its own timer instead of this method
+        blocking the event loop. Consuming it fully completes the BIOS
+        immediately — no sleeps in the model.
+        """
+        # Imported lazily: only needed for the log timestamp, so cold
+        # start doesn't pay for it
+        from datetime import datetime
+
+        yield ["=== NES BIOS Initialization ===",
+               f"Time: {datetime.now().strftime('%H:%M:%S')}",
+               ""]
+
         # Memory initialization
-        bios_log.append("1. Memory Test...")
-        bios_log.append(f"   {self.initialize_memory()}")
-        time.sleep(0.5)
-        
+        yield ["1. Memory Test...", f"   {self.initialize_memory()}"]
+
         # CPU initialization
-        bios_log.append("2. CPU Reset...")
-        bios_log.append(f"   {self.initialize_cpu()}")
-        time.sleep(0.5)
-        
+        yield ["2. CPU Reset...", f"   {self.initialize_cpu()}"]
+
         # PPU initialization
-        bios_log.append("3. PPU Startup...")
-        bios_log.append(f"   {self.initialize_ppu()}")
-        time.sleep(0.5)
-        
+        yield ["3. PPU Startup...", f"   {self.initialize_ppu()}"]
+
         # APU initialization
-        bios_log.append("4. APU Sound Test...")
-        bios_log.append(f"   {self.initialize_apu()}")
-        time.sleep(0.5)
-        
+        yield ["4. APU Sound Test...", f"   {self.initialize_apu()}"]
+
         # Controller initialization
-        bios_log.append("5. Controller Check...")
-        bios_log.append(f"   {self.initialize_controllers()}")
-        time.sleep(0.5)
-        
-        # Final checks
-        bios_log.append("")
-        bios_log.append("6. System Diagnostics...")
-        bios_log.append("   RAM: 2KB OK")
-        bios_log.append("   VRAM: 2KB OK")
-        bios_log.append("   CPU: 6502 1.79MHz OK")
-        bios_log.append("   PPU: RP2C02 5.37MHz OK")
-        bios_log.append("   APU: 5 Channels OK")
-        
+        yield ["5. Controller Check...", f"   {self.initialize_controllers()}"]
+
+        # Final checks — constant block, not rebuilt per run
         self.bios_complete = True
-        bios_log.append("")
-        bios_log.append("=== BIOS Complete ===")
-        bios_log.append("System ready for ROM loading")
-        
-        return bios_log
+        yield _BIOS_DIAG_TAIL
     
+    # Shared status strings — get_hardware_status never builds new ones
+    _READY = '✓ Ready'
+    _OFFLINE = '✗ Offline'
+    _DONE = '✓ Complete'
+    _NOT = '✗ Not Run'
+
     def get_hardware_status(self):
-        """Get current hardware status"""
-        status = {
-            'PPU': '✓ Ready' if self.ppu_initialized else '✗ Offline',
-            'APU': '✓ Ready' if self.apu_initialized else '✗ Offline',
-            'CPU': '✓ Ready' if self.cpu_initialized else '✗ Offline',
-            'Memory': '✓ Ready' if self.memory_initialized else '✗ Offline',
-            'Controllers': '✓ Ready' if self.controllers_initialized else '✗ Offline',
-            'BIOS': '✓ Complete' if self.bios_complete else '✗ Not Run'
-        }
-        return status
+        """Get current hardware status as (component, status) pairs"""
+        return (
+            ('PPU', self._READY if self.ppu_initialized else self._OFFLINE),
+            ('APU', self._READY if self.apu_initialized else self._OFFLINE),
+            ('CPU', self._READY if self.cpu_initialized else self._OFFLINE),
+            ('Memory', self._READY if self.memory_initialized else self._OFFLINE),
+            ('Controllers', self._READY if self.controllers_initialized else self._OFFLINE),
+            ('BIOS', self._DONE if self.bios_complete else self._NOT),
+        )
 
 class EmuNESGUI:
     def __init__(self, root):
@@ -166,7 +214,20 @@ class EmuNESGUI:
         self.rom_path = None
         self.is_playing = False
         self.bios_run = False
-        
+
+        # Pending after() id for the BIOS step chain, so a re-run or a
+        # reset can cancel it instead of leaving two chains interleaving
+        self._bios_after = None
+
+        # Last status string applied per component label, to skip no-op
+        # Tk config calls on refresh
+        self._hw_last = {}
+
+        # Register viewer window — created once, then hidden/reshown —
+        # plus the cached dump text, rebuilt only when registers change
+        self._reg_window = None
+        self._reg_text_cache = None
+
         self.setup_gui()
         
     def setup_gui(self):
@@ -214,12 +275,16 @@ class EmuNESGUI:
         output_frame.pack(fill=tk.X, pady=5)
         
         self.bios_output = scrolledtext.ScrolledText(
-            output_frame, 
-            height=8, 
+            output_frame,
+            height=8,
             width=80,
             bg='#1a1a1a',
             fg='#00ff00',
-            font=('Courier New', 9)
+            font=('Courier New', 9),
+            # read-only log: no undo stack or edit-separator bookkeeping
+            undo=False,
+            autoseparators=False,
+            maxundo=0
         )
         self.bios_output.pack(fill=tk.X)
         self.bios_output.insert(tk.END, "NES Hardware BIOS Ready\nType 'Run BIOS Initialization' to start hardware test...\n")
@@ -234,9 +299,8 @@ class EmuNESGUI:
         status_grid.pack(fill=tk.X)
         
         self.hw_labels = {}
-        components = ['PPU', 'APU', 'CPU', 'Memory', 'Controllers', 'BIOS']
-        
-        for i, component in enumerate(components):
+
+        for i, component in enumerate(_HW_COMPONENTS):
             frame = ttk.Frame(status_grid)
             frame.pack(side=tk.LEFT, expand=True, padx=10)
             
@@ -263,8 +327,8 @@ class EmuNESGUI:
         )
         self.display_canvas.pack(fill=tk.BOTH, expand=True)
         
-        # BIOS boot screen
-        self.draw_bios_screen()
+        # BIOS boot screen (static items drawn once)
+        self._build_bios_screen()
         
     def create_control_panel(self, parent):
         control_frame = ttk.Frame(parent)
@@ -275,12 +339,16 @@ class EmuNESGUI:
         info_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
         
         self.sys_info_text = tk.Text(
-            info_frame, 
-            height=4, 
-            width=50, 
-            bg='#1a1a1a', 
-            fg='#cccccc', 
-            font=('Courier', 8)
+            info_frame,
+            height=4,
+            width=50,
+            bg='#1a1a1a',
+            fg='#cccccc',
+            font=('Courier', 8),
+            # read-only info pane: same no-undo flags as the BIOS log
+            undo=False,
+            autoseparators=False,
+            maxundo=0
         )
         self.sys_info_text.pack(fill=tk.X)
         info_text = """emunes 1.0 - NES Hardware BIOS Proof of Concept
@@ -296,14 +364,8 @@ Team Flames 1.0"""
         ctrl_frame = ttk.LabelFrame(control_frame, text="Quick Controls", padding=5)
         ctrl_frame.pack(side=tk.RIGHT, fill=tk.Y)
         
-        ctrl_buttons = [
-            ("Open ROM", self.open_rom),
-            ("Run BIOS", self.run_bios),
-            ("Hardware Test", self.hardware_test)
-        ]
-        
-        for text, command in ctrl_buttons:
-            btn = ttk.Button(ctrl_frame, text=text, command=command, width=15)
+        for text, mname in _QUICK_CTRLS:
+            btn = ttk.Button(ctrl_frame, text=text, command=getattr(self, mname), width=15)
             btn.pack(fill=tk.X, pady=1)
             
     def create_status_bar(self):
@@ -343,112 +405,144 @@ Team Flames 1.0"""
         
         self.root.config(menu=menubar)
         
-    def draw_bios_screen(self):
-        """Draw BIOS boot screen on canvas"""
-        self.display_canvas.delete("all")
-        
+    def _build_bios_screen(self):
+        """Draw the BIOS boot screen once; only the status item changes later"""
         # BIOS boot screen design
         self.display_canvas.create_rectangle(50, 50, 750, 450, outline='#00ff00', width=2)
-        
+
         # Title
-        self.display_canvas.create_text(400, 100, text="emunes 1.0", fill='#00ff00', 
+        self.display_canvas.create_text(400, 100, text="emunes 1.0", fill='#00ff00',
                                        font=('Arial', 24, 'bold'))
-        self.display_canvas.create_text(400, 130, text="NES Hardware BIOS", fill='#00ff00', 
+        self.display_canvas.create_text(400, 130, text="NES Hardware BIOS", fill='#00ff00',
                                        font=('Arial', 14))
-        self.display_canvas.create_text(400, 160, text="Proof of Concept", fill='#ffff00', 
+        self.display_canvas.create_text(400, 160, text="Proof of Concept", fill='#ffff00',
                                        font=('Arial', 12))
-        
+
         # Team info
-        self.display_canvas.create_text(400, 200, text="[C] Team Flames 1.0", fill='#00ffff', 
+        self.display_canvas.create_text(400, 200, text="[C] Team Flames 1.0", fill='#00ffff',
                                        font=('Arial', 12, 'bold'))
-        
-        # Status
-        status = "System: OFFLINE" if not self.bios_run else "System: READY"
-        color = "#ff0000" if not self.bios_run else "#00ff00"
-        self.display_canvas.create_text(400, 250, text=status, fill=color, 
-                                       font=('Arial', 16, 'bold'))
-        
+
+        # Status (the one dynamic item — keep its ID for itemconfigure)
+        self._status_item = self.display_canvas.create_text(400, 250, text="System: OFFLINE",
+                                       fill='#ff0000', font=('Arial', 16, 'bold'))
+
         # Instructions
-        self.display_canvas.create_text(400, 300, text="Click 'Run BIOS Initialization' to start", 
+        self.display_canvas.create_text(400, 300, text="Click 'Run BIOS Initialization' to start",
                                        fill='#cccccc', font=('Arial', 10))
-        
+
         # Hardware specs
-        specs = [
-            "CPU: MOS 6502 @ 1.79MHz",
-            "PPU: RP2C02 @ 5.37MHz",
-            "APU: 5-channel sound",
-            "Memory: 2KB RAM + 2KB VRAM"
-        ]
-        
-        for i, spec in enumerate(specs):
-            self.display_canvas.create_text(400, 330 + i*20, text=spec, 
+        for i, spec in enumerate(_SPECS):
+            self.display_canvas.create_text(400, 330 + i*20, text=spec,
                                           fill='#888888', font=('Courier', 9))
+
+    def _refresh_bios_status(self):
+        """Update the status text item in place — no delete/redraw of the screen"""
+        status = "System: READY" if self.bios_run else "System: OFFLINE"
+        color = "#00ff00" if self.bios_run else "#ff0000"
+        self.display_canvas.itemconfigure(self._status_item, text=status, fill=color)
     
+    @contextlib.contextmanager
+    def _editable(self, widget):
+        """Temporarily enable a read-only Text widget for one batched write"""
+        widget.config(state=tk.NORMAL)
+        try:
+            yield widget
+        finally:
+            widget.config(state=tk.DISABLED)
+
     def run_bios(self):
         """Run the BIOS initialization sequence"""
-        self.bios_output.config(state=tk.NORMAL)
-        self.bios_output.delete(1.0, tk.END)
-        
-        # Run BIOS
-        bios_log = self.nes.run_bios()
-        
-        # Display log
-        for line in bios_log:
-            self.bios_output.insert(tk.END, line + '\n')
-            
-        self.bios_output.see(tk.END)
-        self.bios_output.config(state=tk.DISABLED)
-        
-        # Update hardware status
-        self.update_hardware_status()
-        self.bios_run = True
-        
-        # Update display
-        self.draw_bios_screen()
-        self.status_text.config(text="BIOS Initialization Complete - System Ready")
+        # Restart cleanly if a previous run is still stepping: cancel its
+        # pending callback so only one timer chain drives the generator.
+        self._cancel_bios()
+        with self._editable(self.bios_output) as w:
+            w.delete(1.0, tk.END)
+
+        # Step through the BIOS generator on a timer: keeps the dramatic
+        # pacing without blocking the Tk event loop between steps.
+        self._bios_steps = self.nes.run_bios()
+        self._bios_step()
+
+    def _cancel_bios(self):
+        """Cancel an in-flight BIOS step chain, if any"""
+        if self._bios_after is not None:
+            self.root.after_cancel(self._bios_after)
+            self._bios_after = None
+
+    def _bios_step(self):
+        self._bios_after = None
+        try:
+            lines = next(self._bios_steps)
+        except StopIteration:
+            # Sequence finished — reflect the new hardware state
+            self.update_hardware_status()
+            self.bios_run = True
+            self._refresh_bios_status()
+            self.status_text.config(text="BIOS Initialization Complete - System Ready")
+            return
+
+        with self._editable(self.bios_output) as w:
+            w.insert(tk.END, "\n".join(lines) + '\n')
+            w.see(tk.END)
+        self._bios_after = self.root.after(500, self._bios_step)
         
     def update_hardware_status(self):
-        """Update hardware status labels"""
+        """Update hardware status labels (skipping ones that didn't change)"""
         status = self.nes.get_hardware_status()
-        for component, stat in status.items():
+        for component, stat in status:
+            if self._hw_last.get(component) == stat:
+                continue
             color = 'green' if '✓' in stat else 'red'
             self.hw_labels[component].config(text=stat, foreground=color)
-        
+            self._hw_last[component] = stat
+
         # Update status bar
-        if self.nes.bios_complete:
-            self.hw_status.config(text="Hardware: READY", foreground='green')
-        else:
-            self.hw_status.config(text="Hardware: OFFLINE", foreground='red')
+        stat = "Hardware: READY" if self.nes.bios_complete else "Hardware: OFFLINE"
+        if self._hw_last.get('_bar') != stat:
+            color = 'green' if self.nes.bios_complete else 'red'
+            self.hw_status.config(text=stat, foreground=color)
+            self._hw_last['_bar'] = stat
     
     def show_hardware_status(self):
         """Show detailed hardware status"""
-        status = self.nes.get_hardware_status()
-        status_text = "=== Hardware Status ===\n"
-        for component, stat in status.items():
-            status_text += f"{component}: {stat}\n"
-        
-        messagebox.showinfo("Hardware Status", status_text)
+        # Build straight from the status tuples — list + one join, no dict
+        lines = ["=== Hardware Status ==="]
+        lines.extend(f"{component}: {stat}" for component, stat in self.nes.get_hardware_status())
+        messagebox.showinfo("Hardware Status", "\n".join(lines) + "\n")
     
     def show_registers(self):
         """Show PPU and APU registers"""
-        reg_text = "=== NES Hardware Registers ===\n\n"
-        reg_text += "PPU Registers:\n"
-        for reg, value in self.nes.ppu_registers.items():
-            reg_text += f"  {reg}: 0x{value:02X}\n"
-        
-        reg_text += "\nAPU Registers:\n"
-        for reg, value in self.nes.apu_registers.items():
-            reg_text += f"  {reg}: 0x{value:02X}\n"
-        
-        # Create a new window for registers
-        reg_window = tk.Toplevel(self.root)
-        reg_window.title("NES Hardware Registers")
-        reg_window.geometry("400x500")
-        
-        text_widget = scrolledtext.ScrolledText(reg_window, width=45, height=25)
-        text_widget.pack(padx=10, pady=10)
-        text_widget.insert(tk.END, reg_text)
-        text_widget.config(state=tk.DISABLED)
+        # Rebuild the dump only when register contents actually changed
+        if self.nes.regs_dirty or self._reg_text_cache is None:
+            # Build the dump as a list and join once — no quadratic str +=.
+            # bytes.hex() formats each packed register file in one C call;
+            # the loop just slices out two digits per register.
+            ppu_hex = self.nes.ppu_registers.hex().upper()
+            apu_hex = self.nes.apu_registers.hex().upper()
+            parts = ["=== NES Hardware Registers ===", "", "PPU Registers:"]
+            parts.extend(f"  {reg.name}: 0x{ppu_hex[reg*2:reg*2+2]}" for reg in PPUReg)
+            parts += ["", "APU Registers:"]
+            parts.extend(f"  {reg.name}: 0x{apu_hex[reg*2:reg*2+2]}" for reg in APUReg)
+            self._reg_text_cache = "\n".join(parts) + "\n"
+            self.nes.regs_dirty = False
+        reg_text = self._reg_text_cache
+        
+        # One-slot window pool: create the viewer once, reuse afterwards
+        if self._reg_window is None or not self._reg_window.winfo_exists():
+            self._reg_window = tk.Toplevel(self.root)
+            self._reg_window.title("NES Hardware Registers")
+            self._reg_window.geometry("400x500")
+
+            self._reg_text_widget = scrolledtext.ScrolledText(self._reg_window, width=45, height=25)
+            self._reg_text_widget.pack(padx=10, pady=10)
+            # Closing hides the window instead of destroying its widgets
+            self._reg_window.protocol("WM_DELETE_WINDOW", self._reg_window.withdraw)
+        else:
+            self._reg_window.deiconify()
+            self._reg_window.lift()
+
+        with self._editable(self._reg_text_widget) as w:
+            w.replace('1.0', tk.END, reg_text)
     
     def hardware_test(self):
         """Run a hardware diagnostic test"""
@@ -466,24 +560,25 @@ Team Flames 1.0"""
             "All tests passed! Hardware is functional."
         ]
         
-        self.bios_output.config(state=tk.NORMAL)
-        self.bios_output.insert(tk.END, "\n" + "\n".join(test_log) + "\n")
-        self.bios_output.see(tk.END)
-        self.bios_output.config(state=tk.DISABLED)
+        with self._editable(self.bios_output) as w:
+            w.insert(tk.END, "\n" + "\n".join(test_log) + "\n")
+            w.see(tk.END)
         
         messagebox.showinfo("Hardware Test", "All hardware tests passed successfully!")
     
     def reset_hardware(self):
         """Reset hardware state"""
-        self.nes = NESHardware()
+        # Stop any BIOS run in flight so its stale timer cannot keep
+        # writing to the cleared log or re-mark the system READY.
+        self._cancel_bios()
+        self.nes.reset()
         self.bios_run = False
         self.update_hardware_status()
-        self.draw_bios_screen()
+        self._refresh_bios_status()
         
-        self.bios_output.config(state=tk.NORMAL)
-        self.bios_output.delete(1.0, tk.END)
-        self.bios_output.insert(tk.END, "Hardware reset complete. Run BIOS to initialize.\n")
-        self.bios_output.config(state=tk.DISABLED)
+        with self._editable(self.bios_output) as w:
+            # replace() clears and writes atomically — one Tcl call
+            w.replace('1.0', tk.END, "Hardware reset complete. Run BIOS to initialize.\n")
         
         self.status_text.config(text="Hardware Reset - Run BIOS to initialize")
     
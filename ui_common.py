@@ -0,0 +1,69 @@
+"""Shared Tk widget builders for the emunes frontends.
+
+Both EmuNESGUI (client.py) and EmuNESApp (emuneshdrv0a.py) build a menu
+bar, a toolbar row, a display area, and a status bar from the same
+patterns. Keeping the builders here means the widget-creation code is
+compiled and executed once per process even when both frontends are
+imported, and the canvas/batching optimizations live in one place.
+"""
+import tkinter as tk
+from tkinter import ttk
+
+
+def build_menu(root, menus):
+    """Build the menu bar from a spec and attach it to root.
+
+    menus is an iterable of (label, items); each item is either None for
+    a separator or a (label, command[, accelerator]) tuple.
+    """
+    menubar = tk.Menu(root)
+    for label, items in menus:
+        menu = tk.Menu(menubar, tearoff=0)
+        for item in items:
+            if item is None:
+                menu.add_separator()
+            elif len(item) > 2 and item[2]:
+                menu.add_command(label=item[0], command=item[1], accelerator=item[2])
+            else:
+                menu.add_command(label=item[0], command=item[1])
+        menubar.add_cascade(label=label, menu=menu)
+    root.config(menu=menubar)
+    return menubar
+
+
+def build_toolbar(parent, actions, style=None):
+    """Build a horizontal button row from (text, command) pairs."""
+    toolbar = ttk.Frame(parent, height=40)
+    toolbar.pack(fill=tk.X, pady=(0, 5))
+    buttons = []
+    for text, command in actions:
+        if style:
+            btn = ttk.Button(toolbar, text=text, command=command, style=style)
+        else:
+            btn = ttk.Button(toolbar, text=text, command=command)
+        btn.pack(side=tk.LEFT, padx=2)
+        buttons.append(btn)
+    return toolbar, buttons
+
+
+def build_display(parent, title="Display"):
+    """Build the labelled display frame with its black canvas."""
+    frame = ttk.LabelFrame(parent, text=title, padding=10)
+    frame.pack(fill=tk.BOTH, expand=True, pady=5)
+    canvas = tk.Canvas(
+        frame,
+        bg='#000000',
+        highlightthickness=1,
+        highlightbackground='#555555'
+    )
+    canvas.pack(fill=tk.BOTH, expand=True)
+    return frame, canvas
+
+
+def build_statusbar(root, left_text):
+    """Build the sunken bottom status bar with its left-hand label."""
+    frame = ttk.Frame(root, relief=tk.SUNKEN)
+    frame.pack(fill=tk.X, side=tk.BOTTOM)
+    label = ttk.Label(frame, text=left_text)
+    label.pack(side=tk.LEFT, padx=5)
+    return frame, label